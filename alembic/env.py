@@ -37,6 +37,27 @@ config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 target_metadata = Base.metadata
 
 
+def include_name(name: str | None, type_: str, parent_names: dict[str, str | None]) -> bool:
+    """autogenerate가 리플렉션할 객체 이름을 필터링.
+
+    Args:
+        name: 객체 이름
+        type_: 객체 종류 ("schema", "table", "column", "index" 등)
+        parent_names: 상위 객체 이름 정보
+
+    Returns:
+        리플렉션 대상이면 True
+
+    autogenerate는 DB의 모든 테이블을 테이블마다 개별 쿼리로 리플렉션합니다.
+    같은 DB를 다른 서비스와 공유하면 관련 없는 테이블까지 조회하게 되므로,
+    Base.metadata에 정의된 테이블만 리플렉션하여 DB 왕복 횟수를 줄입니다.
+    (모델에서 삭제한 테이블의 drop은 감지되지 않으므로 직접 작성해야 합니다.)
+    """
+    if type_ == "table":
+        return name in target_metadata.tables
+    return True
+
+
 def run_migrations_offline() -> None:
     """오프라인 모드에서 마이그레이션 실행.
 
@@ -67,7 +88,11 @@ def do_run_migrations(connection: Connection) -> None:
     이 함수는 run_async_migrations에서 connection.run_sync()를 통해 호출됩니다.
     비동기 연결에서 동기 함수를 실행하기 위한 어댑터 역할을 합니다.
     """
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,  # 모델에 정의된 테이블만 리플렉션
+    )
 
     with context.begin_transaction():
         context.run_migrations()
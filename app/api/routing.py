@@ -0,0 +1,66 @@
+"""Custom API route classes."""
+
+import inspect
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+
+def _uses_response_param(dependant: Dependant) -> bool:
+    """Whether the endpoint or any of its dependencies takes a ``response: Response``."""
+    return dependant.response_param_name is not None or any(
+        _uses_response_param(sub) for sub in dependant.dependencies
+    )
+
+
+class JSONRoute(APIRoute):
+    """Route that serializes the response model straight to JSON bytes.
+
+    FastAPI dumps ``response_model`` values to Python objects and then walks the
+    result again with ``jsonable_encoder`` before ``json.dumps``. This route dumps
+    the endpoint's return value with a ``TypeAdapter`` of the response model
+    instead, so the whole model -> JSON conversion happens in pydantic-core.
+
+    Endpoints must return instances of their response model: the return value is
+    not re-validated. Returning a ``Response`` still bypasses serialization.
+
+    Routes whose endpoint or dependencies take a ``response: Response`` parameter
+    keep FastAPI's normal handling: headers, cookies and status codes set on that
+    parameter would otherwise be lost with the response built here.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Build the route handler around a JSON-dumping endpoint call."""
+        call = self.dependant.call
+        if (
+            self.response_field is not None
+            and inspect.iscoroutinefunction(call)
+            and not _uses_response_param(self.dependant)
+        ):
+            self.dependant.call = self._dump_json_call(call)
+        return super().get_route_handler()
+
+    def _dump_json_call(
+        self, call: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Coroutine[Any, Any, Response]]:
+        """Wrap an endpoint so its return value is rendered with pydantic-core."""
+        adapter: TypeAdapter[Any] = TypeAdapter(self.response_model)
+        status_code = self.status_code or 200
+
+        @wraps(call)
+        async def endpoint(**values: Any) -> Response:
+            content = await call(**values)
+            if isinstance(content, Response):
+                return content
+            return Response(
+                content=adapter.dump_json(content),
+                status_code=status_code,
+                media_type="application/json",
+            )
+
+        return endpoint
@@ -4,12 +4,13 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 
+from app.api.routing import JSONRoute
 from app.core.deps import DBSession
 from app.schemas.batch import BatchCreate, BatchListResponse, BatchResponse
-from app.schemas.task import TaskResponse
-from app.services.batch_service import BatchService
+from app.services.batch_service import BatchService, batch_cache
+from app.utils.pagination import decode_cursor, encode_cursor
 
-router = APIRouter()
+router = APIRouter(route_class=JSONRoute)
 
 BATCHES_PER_PAGE = 10
 
@@ -36,13 +37,7 @@ async def create_batch(
     service = BatchService(db)
     batch = await service.create(batch_data)
 
-    return BatchResponse(
-        id=batch.id,
-        session_id=batch.session_id,
-        reason=batch.reason,
-        created_at=batch.created_at,
-        tasks=[TaskResponse.model_validate(task) for task in batch.tasks],
-    )
+    return BatchResponse.from_row(batch)
 
 
 @router.get(
@@ -54,6 +49,9 @@ async def list_batches(
     db: DBSession,
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
     session_id: UUID | None = Query(default=None, description="Filter by session ID"),
+    cursor: str | None = Query(
+        default=None, description="Keyset cursor from a previous response (overrides page)"
+    ),
 ) -> BatchListResponse:
     """Get paginated list of batches.
 
@@ -61,27 +59,34 @@ async def list_batches(
         db: Database session
         page: Page number (1-indexed)
         session_id: Optional session ID filter
+        cursor: Optional next_cursor from a previous page
 
     Returns:
         Paginated batch list
+
+    Raises:
+        ValidationError: 422 if the cursor is invalid
     """
+    after = decode_cursor(cursor, "created_at", "desc") if cursor is not None else None
+
     service = BatchService(db)
-    batches, total = await service.get_list(page=page, session_id=session_id)
+    batches, total, has_more = await service.get_list(page=page, session_id=session_id, after=after)
+
+    next_cursor = None
+    if has_more:
+        last = batches[-1]
+        next_cursor = encode_cursor("created_at", "desc", last.created_at, last.id)
 
+    # A cursor page has no page number; has_next/has_prev come from the fetched rows
+    # (they are recomputed from page and total otherwise)
     return BatchListResponse(
-        items=[
-            BatchResponse(
-                id=batch.id,
-                session_id=batch.session_id,
-                reason=batch.reason,
-                created_at=batch.created_at,
-                tasks=[TaskResponse.model_validate(task) for task in batch.tasks],
-            )
-            for batch in batches
-        ],
+        items=[BatchResponse.from_row(batch) for batch in batches],
         total=total,
-        page=page,
+        page=page if after is None else None,
         limit=BATCHES_PER_PAGE,
+        next_cursor=next_cursor,
+        has_next=has_more,
+        has_prev=after is not None,
     )
 
 
@@ -109,13 +114,7 @@ async def get_latest_batch(
     if batch is None:
         return None
 
-    return BatchResponse(
-        id=batch.id,
-        session_id=batch.session_id,
-        reason=batch.reason,
-        created_at=batch.created_at,
-        tasks=[TaskResponse.model_validate(task) for task in batch.tasks],
-    )
+    return BatchResponse.from_row(batch)
 
 
 @router.get(
@@ -129,6 +128,9 @@ async def get_batch(
 ) -> BatchResponse:
     """Get a batch by ID with tasks.
 
+    Found batches are cached for a couple of seconds, so repeated polling of the
+    same ID skips the database.
+
     Args:
         batch_id: Batch UUID
         db: Database session
@@ -139,6 +141,10 @@ async def get_batch(
     Raises:
         HTTPException: 404 if batch not found
     """
+    cached = batch_cache.get(batch_id)
+    if cached is not None:
+        return cached
+
     service = BatchService(db)
     batch = await service.get_by_id(batch_id)
 
@@ -148,10 +154,6 @@ async def get_batch(
             detail=f"Batch {batch_id} not found",
         )
 
-    return BatchResponse(
-        id=batch.id,
-        session_id=batch.session_id,
-        reason=batch.reason,
-        created_at=batch.created_at,
-        tasks=[TaskResponse.model_validate(task) for task in batch.tasks],
-    )
+    response = BatchResponse.from_row(batch)
+    batch_cache.set(batch_id, response)
+    return response
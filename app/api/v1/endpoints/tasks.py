@@ -5,7 +5,9 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 
+from app.api.routing import JSONRoute
 from app.core.deps import DBSession
+from app.core.exceptions import ValidationError
 from app.models.task import TaskStatus
 from app.schemas.task import (
     TaskBulkDelete,
@@ -17,9 +19,10 @@ from app.schemas.task import (
     TaskResponse,
     TaskUpdate,
 )
-from app.services.task_service import TaskService
+from app.services.task_service import KEYSET_SORT_FIELDS, TaskService, task_cache
+from app.utils.pagination import decode_cursor, encode_cursor
 
-router = APIRouter()
+router = APIRouter(route_class=JSONRoute)
 
 # Fixed limit: 10 tasks per page
 TASKS_PER_PAGE = 10
@@ -46,7 +49,7 @@ async def create_task(
     """
     service = TaskService(db)
     task = await service.create(task_data)
-    return TaskResponse.model_validate(task)
+    return TaskResponse.from_row(task)
 
 
 @router.get(
@@ -64,6 +67,11 @@ async def list_tasks(
         default="updated_at", description="Sort field"
     ),
     order: Literal["asc", "desc"] = Query(default="desc", description="Sort order"),
+    cursor: str | None = Query(
+        default=None,
+        description="Keyset cursor from a previous response (overrides page); "
+        "only for sort_by updated_at/created_at",
+    ),
 ) -> TaskListResponse:
     """Get paginated list of tasks with filtering and sorting.
 
@@ -75,25 +83,50 @@ async def list_tasks(
         batch_id: Optional batch ID filter
         sort_by: Sort field (default: updated_at)
         order: Sort order (default: desc)
+        cursor: Optional next_cursor from a previous page
 
     Returns:
         Paginated task list
+
+    Raises:
+        ValidationError: 422 if the cursor is invalid, was issued for another sort_by or
+            order, or sort_by does not support cursors
     """
+    after = None
+    if cursor is not None:
+        if sort_by not in KEYSET_SORT_FIELDS:
+            raise ValidationError(
+                "Cursor pagination requires sort_by=updated_at or created_at",
+                details={"sort_by": sort_by},
+            )
+        after = decode_cursor(cursor, sort_by, order)
+
     service = TaskService(db)
-    tasks, total = await service.get_list(
+    tasks, total, has_more = await service.get_list(
         page=page,
         status=status,
         session_id=session_id,
         batch_id=batch_id,
         sort_by=sort_by,
         order=order,
+        after=after,
     )
 
+    next_cursor = None
+    if sort_by in KEYSET_SORT_FIELDS and has_more:
+        last = tasks[-1]
+        next_cursor = encode_cursor(sort_by, order, getattr(last, sort_by), last.id)
+
+    # A cursor page has no page number; has_next/has_prev come from the fetched rows
+    # (they are recomputed from page and total otherwise)
     return TaskListResponse(
-        items=[TaskResponse.model_validate(task) for task in tasks],
+        items=[TaskResponse.from_row(task) for task in tasks],
         total=total,
-        page=page,
+        page=page if after is None else None,
         limit=TASKS_PER_PAGE,
+        next_cursor=next_cursor,
+        has_next=has_more,
+        has_prev=after is not None,
     )
 
 
@@ -119,9 +152,7 @@ async def bulk_update_tasks(
     service = TaskService(db)
     updated_tasks = await service.bulk_update(bulk_data)
 
-    return TaskBulkUpdateResponse(
-        updated=[TaskResponse.model_validate(task) for task in updated_tasks]
-    )
+    return TaskBulkUpdateResponse(updated=[TaskResponse.from_row(task) for task in updated_tasks])
 
 
 @router.delete(
@@ -160,6 +191,9 @@ async def get_task(
 ) -> TaskResponse:
     """Get a task by ID.
 
+    Found tasks are cached for a couple of seconds, so repeated polling of the
+    same ID skips the database.
+
     Args:
         task_id: Task UUID
         db: Database session
@@ -170,6 +204,10 @@ async def get_task(
     Raises:
         HTTPException: 404 if task not found
     """
+    cached = task_cache.get(task_id)
+    if cached is not None:
+        return cached
+
     service = TaskService(db)
     task = await service.get_by_id(task_id)
 
@@ -179,7 +217,9 @@ async def get_task(
             detail=f"Task {task_id} not found",
         )
 
-    return TaskResponse.model_validate(task)
+    response = TaskResponse.from_row(task)
+    task_cache.set(task_id, response)
+    return response
 
 
 @router.put(
@@ -218,7 +258,7 @@ async def update_task(
             detail=f"Task {task_id} not found",
         )
 
-    return TaskResponse.model_validate(task)
+    return TaskResponse.from_row(task)
 
 
 @router.delete(
@@ -12,9 +12,22 @@ from app.core.config import settings
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # Replace connections periodically instead of pinging on every checkout
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    # Reuse the most recently returned connection so idle extras can time out
+    pool_use_lifo=True,
+    connect_args={
+        # Keep prepared statements per connection: asyncpg's own cache and the one
+        # SQLAlchemy's asyncpg adapter keeps for the statements it prepares
+        "statement_cache_size": 2048,
+        "prepared_statement_cache_size": 2048,
+        # Skip JIT for short OLTP queries; tag connections in pg_stat_activity
+        "server_settings": {"jit": "off", "application_name": settings.APP_NAME},
+    },
 )
 
 # Session factory
@@ -22,16 +35,19 @@ async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    # Services commit their own units of work; nothing relies on autoflush
+    autoflush=False,
 )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session."""
+    """Get database session.
+
+    The session is closed (and any uncommitted transaction rolled back) when the
+    ``async with`` block exits; services commit their own units of work.
+    """
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 # Type alias for database dependency
@@ -1,30 +1,55 @@
 """Logging configuration."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from collections.abc import MutableMapping
 from typing import Any
 
-from pythonjsonlogger import jsonlogger
+from pydantic_core import to_json
+from pythonjsonlogger import json as jsonlogger
 
 from app.core.config import settings
 
+# Background thread that writes queued records to stdout
+_listener: logging.handlers.QueueListener | None = None
+
+
+class JsonFormatter(jsonlogger.JsonFormatter):
+    """JSON log formatter backed by pydantic-core's Rust JSON encoder."""
+
+    def jsonify_log_record(self, log_record: dict[str, Any]) -> str:
+        """Serialize a log record, falling back to str() for unknown types."""
+        return to_json(log_record, fallback=str).decode()
+
 
 def setup_logging() -> None:
-    """Configure application logging."""
+    """Configure application logging.
+
+    Records are formatted by a QueueHandler on the root logger and written to
+    stdout by a QueueListener thread, so logging calls never block the event
+    loop on the write.
+    """
+    global _listener
+
     logger = logging.getLogger()
     logger.setLevel(settings.LOG_LEVEL)
 
-    # Remove existing handlers
+    # Remove existing handlers (and stop a listener from a previous setup)
     logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
 
     # Create handler
-    handler = logging.StreamHandler(sys.stdout)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
 
     # Configure formatter
     formatter: logging.Formatter
     if settings.LOG_FORMAT == "json":
-        formatter = jsonlogger.JsonFormatter(
+        formatter = JsonFormatter(
             "%(asctime)s %(name)s %(levelname)s %(message)s %(request_id)s",
             rename_fields={"levelname": "level", "asctime": "timestamp"},
         )
@@ -37,6 +62,21 @@ def setup_logging() -> None:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 
+    # The QueueHandler already rendered the final line into the record message
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued records before the process exits."""
+    if _listener is not None:
+        _listener.stop()
+
 
 class LoggerAdapter(logging.LoggerAdapter[logging.Logger]):
     """Logger adapter to add request_id to log records."""
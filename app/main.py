@@ -1,15 +1,19 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy import text
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.api.routing import JSONRoute
 from app.api.v1 import api_router
 from app.core import settings, setup_logging
-from app.core.deps import async_session_maker
+from app.core.deps import async_session_maker, engine
 from app.core.exceptions import AppException
 from app.middleware import (
     LoggingMiddleware,
@@ -20,17 +24,71 @@ from app.middleware import (
     validation_exception_handler,
 )
 from app.schemas import HealthResponse
+from app.utils import HTTPClient
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+
+async def _prewarm_pool() -> None:
+    """Open the pool's connections up front so early requests skip the connect cost."""
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Bounded, so an unreachable database cannot hold startup for the driver's
+    # connect timeout; on timeout the pending connects are cancelled
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(ping() for _ in range(settings.DB_POOL_SIZE)), return_exceptions=True),
+            timeout=settings.DB_PREWARM_TIMEOUT,
+        )
+    except TimeoutError:
+        logger.warning(
+            f"Database pool prewarm timed out after {settings.DB_PREWARM_TIMEOUT}s",
+            extra={"request_id": "startup"},
+        )
+        return
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        logger.warning(
+            f"Database pool prewarm: {len(errors)} of {len(results)} connections failed: {errors[0]}",
+            extra={"request_id": "startup"},
+        )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application startup and shutdown."""
+    logger.info(
+        f"Starting {settings.APP_NAME} v{settings.APP_VERSION}",
+        extra={"request_id": "startup"},
+    )
+    await _prewarm_pool()
+    await HTTPClient.startup()
+
+    yield
+
+    logger.info(
+        f"Shutting down {settings.APP_NAME}",
+        extra={"request_id": "shutdown"},
+    )
+    await HTTPClient.shutdown()
+    await engine.dispose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
+# Routes declared on the app itself (health check) also dump straight to JSON bytes
+app.router.route_class = JSONRoute
 
 # Add middlewares (order matters: first added = outermost layer)
 app.add_middleware(LoggingMiddleware)
@@ -65,24 +123,6 @@ async def health_check() -> HealthResponse:
     )
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Application startup event."""
-    logger.info(
-        f"Starting {settings.APP_NAME} v{settings.APP_VERSION}",
-        extra={"request_id": "startup"},
-    )
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Application shutdown event."""
-    logger.info(
-        f"Shutting down {settings.APP_NAME}",
-        extra={"request_id": "shutdown"},
-    )
-
-
 if __name__ == "__main__":
     import uvicorn
 
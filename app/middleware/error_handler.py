@@ -1,20 +1,44 @@
 """Global error handler middleware."""
 
 import logging
+from typing import Any
 
-from fastapi import Request, status
+from fastapi import Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.exceptions import AppException
 from app.core.logging import LoggerAdapter
 from app.middleware.request_id import get_request_id
+from app.schemas.responses import ErrorResponse
 
 logger = logging.getLogger(__name__)
 
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+def _error_response(
+    status_code: int,
+    message: Any,
+    error_code: str,
+    request_id: str,
+    details: dict[str, Any] | None = None,
+) -> Response:
+    """Render an error body straight to JSON with pydantic-core.
+
+    Handler inputs are trusted, so the model is built with model_construct (no
+    validation or copy of details); values JSON can't represent fall back to str().
+    """
+    fields = {"message": message, "error_code": error_code, "request_id": request_id}
+    if details is not None:
+        fields["details"] = details
+    error = ErrorResponse.model_construct(**fields)
+    return Response(
+        content=error.model_dump_json(fallback=str),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def app_exception_handler(request: Request, exc: AppException) -> Response:
     """Handle custom application exceptions."""
     request_id = get_request_id()
     adapter = LoggerAdapter(logger, {"request_id": request_id})
@@ -28,21 +52,12 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
         },
     )
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "success": False,
-            "message": exc.message,
-            "error_code": exc.__class__.__name__,
-            "details": exc.details,
-            "request_id": request_id,
-        },
+    return _error_response(
+        exc.status_code, exc.message, exc.__class__.__name__, request_id, exc.details
     )
 
 
-async def validation_exception_handler(
-    request: Request, exc: RequestValidationError
-) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
     """Handle validation errors."""
     request_id = get_request_id()
     adapter = LoggerAdapter(logger, {"request_id": request_id})
@@ -53,19 +68,16 @@ async def validation_exception_handler(
         extra={"validation_errors": errors},
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "success": False,
-            "message": "Validation error",
-            "error_code": "ValidationError",
-            "details": {"validation_errors": errors},
-            "request_id": request_id,
-        },
+    return _error_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "Validation error",
+        "ValidationError",
+        request_id,
+        {"validation_errors": errors},
     )
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
     """Handle HTTP exceptions."""
     request_id = get_request_id()
     adapter = LoggerAdapter(logger, {"request_id": request_id})
@@ -75,19 +87,10 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
         extra={"status_code": exc.status_code},
     )
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "success": False,
-            "message": exc.detail,
-            "error_code": "HTTPException",
-            "details": {},
-            "request_id": request_id,
-        },
-    )
+    return _error_response(exc.status_code, exc.detail, "HTTPException", request_id)
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unhandled exceptions."""
     request_id = get_request_id()
     adapter = LoggerAdapter(logger, {"request_id": request_id})
@@ -97,13 +100,9 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
         exc_info=exc,
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "success": False,
-            "message": "Internal server error",
-            "error_code": "InternalServerError",
-            "details": {},
-            "request_id": request_id,
-        },
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "Internal server error",
+        "InternalServerError",
+        request_id,
     )
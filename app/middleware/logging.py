@@ -2,10 +2,9 @@
 
 import logging
 import time
-from collections.abc import Awaitable, Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import LoggerAdapter
 from app.middleware.request_id import get_request_id
@@ -13,44 +12,63 @@ from app.middleware.request_id import get_request_id
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all requests and responses."""
+class LoggingMiddleware:
+    """Middleware to log all requests and responses.
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    Plain ASGI middleware: timing and the X-Process-Time header are handled by
+    wrapping ``send`` instead of going through BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with logging."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         request_id = get_request_id()
         adapter = LoggerAdapter(logger, {"request_id": request_id})
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
         # Log request
         adapter.info(
-            f"Request started: {request.method} {request.url.path}",
+            f"Request started: {method} {path}",
             extra={
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "client_host": request.client.host if request.client else None,
+                "method": method,
+                "path": path,
+                "query_params": scope["query_string"].decode("latin-1"),
+                "client_host": client[0] if client else None,
             },
         )
 
-        # Process request and measure time
-        start_time = time.time()
-        response: Response = await call_next(request)
-        process_time = time.time() - start_time
+        # Process request and measure time until the response starts
+        start_time = time.perf_counter()
+        status_code = 500
+        process_time = 0.0
+
+        async def send_with_process_time(message: Message) -> None:
+            nonlocal status_code, process_time
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+                # Add process time header
+                MutableHeaders(scope=message)["X-Process-Time"] = f"{process_time:.3f}"
+            await send(message)
+
+        await self.app(scope, receive, send_with_process_time)
 
         # Log response
         adapter.info(
-            f"Request completed: {request.method} {request.url.path} - {response.status_code}",
+            f"Request completed: {method} {path} - {status_code}",
             extra={
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "process_time": f"{process_time:.3f}s",
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "process_time_ms": round(process_time * 1000),
             },
         )
-
-        # Add process time header
-        response.headers["X-Process-Time"] = f"{process_time:.3f}"
-
-        return response
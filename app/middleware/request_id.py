@@ -1,11 +1,10 @@
 """Request ID middleware."""
 
 import uuid
-from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable for request ID
 request_id_ctx_var: ContextVar[str] = ContextVar("request_id", default="")
@@ -16,23 +15,33 @@ def get_request_id() -> str:
     return request_id_ctx_var.get()
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to add request ID to all requests."""
+class RequestIDMiddleware:
+    """Middleware to add request ID to all requests.
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    Plain ASGI middleware, so requests don't pay for the task group and memory
+    stream that BaseHTTPMiddleware wraps around every call.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and add request ID."""
-        # Get request ID from header or generate new one
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Get request ID from header or generate new one (only when the header is missing)
+        request_id = Headers(scope=scope).get("X-Request-ID") or uuid.uuid4().hex
 
         # Set in context variable
         request_id_ctx_var.set(request_id)
 
-        # Process request
-        response: Response = await call_next(request)
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            # Add request ID to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_request_id)
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Text
+from sqlalchemy import DateTime, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -20,6 +20,12 @@ class TaskBatch(Base):
     """TaskBatch model for grouping tasks created together."""
 
     __tablename__ = "task_batches"
+    # Indexes for the list query: optional session filter, then created_at and id,
+    # matching the ORDER BY and the keyset seek
+    __table_args__ = (
+        Index("idx_task_batches_created_at", "created_at", "id"),
+        Index("idx_task_batches_session_id_created_at", "session_id", "created_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     session_id: Mapped[UUID | None] = mapped_column(nullable=True, default=None)
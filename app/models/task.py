@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -37,6 +37,15 @@ class Task(Base):
     """Task model for managing todo items."""
 
     __tablename__ = "tasks"
+    # Indexes for the list query: filter column(s), then the sort key and id tie-breaker
+    __table_args__ = (
+        Index("idx_tasks_updated_at", "updated_at", "id"),
+        Index("idx_tasks_session_id_updated_at", "session_id", "updated_at", "id"),
+        Index("idx_tasks_status_updated_at", "status", "updated_at", "id"),
+        Index("idx_tasks_batch_id", "batch_id"),
+    )
+    # Fetch SQL-side defaults (created_at/updated_at) with RETURNING on INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     # Required fields
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
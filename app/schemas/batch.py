@@ -1,9 +1,10 @@
 """Pydantic schemas for Batch API."""
 
 from datetime import datetime
+from typing import Any, Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, model_validator
 
 from app.schemas.task import TaskCreate, TaskResponse
 
@@ -25,7 +26,25 @@ class BatchResponse(BaseModel):
     created_at: datetime
     tasks: list[TaskResponse] = Field(default_factory=list)
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
+
+    @classmethod
+    def from_row(cls, batch: Any) -> "BatchResponse":
+        """Build a response from a trusted TaskBatch with loaded tasks, skipping validation.
+
+        Args:
+            batch: TaskBatch ORM instance
+
+        Returns:
+            Batch response
+        """
+        return cls.model_construct(
+            id=batch.id,
+            session_id=batch.session_id,
+            reason=batch.reason,
+            created_at=batch.created_at,
+            tasks=[TaskResponse.from_row(task) for task in batch.tasks],
+        )
 
 
 # 이건 필요없을 것 같긴 한데 일단
@@ -33,24 +52,34 @@ class BatchListResponse(BaseModel):
     """Schema for paginated batch list response."""
 
     items: list[BatchResponse]
-    total: int = Field(..., description="Total number of batches")
-    page: int = Field(..., description="Current page number")
+    total: int | None = Field(
+        ..., description="Total number of batches, None when the page was fetched by cursor"
+    )
+    page: int | None = Field(
+        ..., description="Current page number, None when the page was fetched by cursor"
+    )
     limit: int = Field(..., description="Items per page")
-
-    @computed_field  # type: ignore
-    @property
-    def total_pages(self) -> int:
-        """Calculate total number of pages."""
-        return (self.total + self.limit - 1) // self.limit
-
-    @computed_field  # type: ignore
-    @property
-    def has_next(self) -> bool:
-        """Check if there is a next page."""
-        return self.page < self.total_pages
-
-    @computed_field  # type: ignore
-    @property
-    def has_prev(self) -> bool:
-        """Check if there is a previous page."""
-        return self.page > 1
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page (pass as ?cursor=), None on the last page"
+    )
+
+    total_pages: int | None = Field(
+        0, description="Total number of pages, None when the page was fetched by cursor"
+    )
+    has_next: bool = Field(False, description="Whether there is a next page")
+    has_prev: bool = Field(False, description="Whether there is a previous page")
+
+    @model_validator(mode="after")
+    def fill_pagination(self) -> Self:
+        """Compute page helpers once at construction instead of on every dump.
+
+        In cursor mode (page is None) there is no page number or total to derive
+        them from, so has_next/has_prev are left as passed in by the caller.
+        """
+        if self.page is None or self.total is None:
+            self.total_pages = None
+            return self
+        self.total_pages = (self.total + self.limit - 1) // self.limit
+        self.has_next = self.page < self.total_pages
+        self.has_prev = self.page > 1
+        return self
@@ -2,7 +2,7 @@
 
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
@@ -23,7 +23,12 @@ class SuccessResponse(BaseResponse, Generic[T]):
 
 
 class ErrorResponse(BaseResponse):
-    """Error response model."""
+    """Error response model.
+
+    Frozen: error handlers build it once per failure and only serialize it.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     success: bool = Field(default=False, description="Always False for error responses")
     error_code: str = Field(..., description="Error code")
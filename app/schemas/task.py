@@ -1,9 +1,10 @@
 """Pydantic schemas for Task API."""
 
 from datetime import datetime
+from typing import Any, Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, model_validator
 
 from app.models.task import TaskPriority, TaskStatus
 
@@ -51,34 +52,56 @@ class TaskResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
+
+    @classmethod
+    def from_row(cls, row: Any) -> "TaskResponse":
+        """Build a response from a trusted database row without re-validating it.
+
+        Args:
+            row: Task ORM instance or result row exposing every response field
+
+        Returns:
+            Task response
+        """
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
 
 
 class TaskListResponse(BaseModel):
     """Schema for paginated task list response."""
 
     items: list[TaskResponse]
-    total: int = Field(..., description="Total number of tasks")
-    page: int = Field(..., description="Current page number")
+    total: int | None = Field(
+        ..., description="Total number of tasks, None when the page was fetched by cursor"
+    )
+    page: int | None = Field(
+        ..., description="Current page number, None when the page was fetched by cursor"
+    )
     limit: int = Field(..., description="Items per page")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page (pass as ?cursor=), None on the last page"
+    )
 
-    @computed_field  # type: ignore
-    @property
-    def total_pages(self) -> int:
-        """Calculate total number of pages."""
-        return (self.total + self.limit - 1) // self.limit
-
-    @computed_field  # type: ignore
-    @property
-    def has_next(self) -> bool:
-        """Check if there is a next page."""
-        return self.page < self.total_pages
-
-    @computed_field  # type: ignore
-    @property
-    def has_prev(self) -> bool:
-        """Check if there is a previous page."""
-        return self.page > 1
+    total_pages: int | None = Field(
+        0, description="Total number of pages, None when the page was fetched by cursor"
+    )
+    has_next: bool = Field(False, description="Whether there is a next page")
+    has_prev: bool = Field(False, description="Whether there is a previous page")
+
+    @model_validator(mode="after")
+    def fill_pagination(self) -> Self:
+        """Compute page helpers once at construction instead of on every dump.
+
+        In cursor mode (page is None) there is no page number or total to derive
+        them from, so has_next/has_prev are left as passed in by the caller.
+        """
+        if self.page is None or self.total is None:
+            self.total_pages = None
+            return self
+        self.total_pages = (self.total + self.limit - 1) // self.limit
+        self.has_next = self.page < self.total_pages
+        self.has_prev = self.page > 1
+        return self
 
 
 class TaskBulkUpdateItem(TaskUpdate):
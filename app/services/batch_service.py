@@ -1,14 +1,21 @@
 """Batch service for CRUD operations."""
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, lambda_stmt, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.batch import TaskBatch
 from app.models.task import Task
-from app.schemas.batch import BatchCreate
+from app.schemas.batch import BatchCreate, BatchResponse
+from app.utils.cache import TTLCache
+
+# Short-lived per-process cache of GET /batches/{batch_id} responses; cleared on task
+# writes. It holds frozen BatchResponse models, never session-bound TaskBatch instances.
+batch_cache: TTLCache[UUID, BatchResponse] = TTLCache(maxsize=4096, ttl=2)
 
 
 class BatchService:
@@ -31,35 +38,41 @@ class BatchService:
         Returns:
             Created batch with tasks
         """
-        # Create batch
-        batch = TaskBatch(
-            session_id=batch_data.session_id,
-            reason=batch_data.reason,
+        # Create batch (RETURNING gives back the generated id and created_at)
+        result = await self.db.execute(
+            insert(TaskBatch)
+            .values(session_id=batch_data.session_id, reason=batch_data.reason)
+            .returning(TaskBatch)
+        )
+        batch: TaskBatch = result.scalar_one()
+
+        # Create tasks in one executemany INSERT, returned in request order.
+        # render_nulls keeps None values in every row so rows are never split
+        # into separate INSERTs by which optional fields they set.
+        rows = [
+            {
+                "title": task_data.title,
+                "description": task_data.description,
+                "status": task_data.status,
+                "priority": task_data.priority,
+                "due_date": task_data.due_date,
+                "session_id": batch_data.session_id,  # Inherit from batch
+                "batch_id": batch.id,
+            }
+            for task_data in batch_data.tasks
+        ]
+        tasks = await self.db.scalars(
+            insert(Task)
+            .returning(Task, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True),
+            rows,
         )
-        self.db.add(batch)
-        await self.db.flush()  # Get batch.id without committing
-
-        # Create tasks
-        for task_data in batch_data.tasks:
-            task = Task(
-                title=task_data.title,
-                description=task_data.description,
-                status=task_data.status,
-                priority=task_data.priority,
-                due_date=task_data.due_date,
-                session_id=batch_data.session_id,  # Inherit from batch
-                batch_id=batch.id,
-            )
-            self.db.add(task)
 
-        await self.db.commit()
-        await self.db.refresh(batch)
+        # Fill the tasks relationship without reloading the batch
+        set_committed_value(batch, "tasks", list(tasks))
 
-        # Load tasks relationship
-        result = await self.db.execute(
-            select(TaskBatch).where(TaskBatch.id == batch.id).options(selectinload(TaskBatch.tasks))
-        )
-        return result.scalar_one()
+        await self.db.commit()
+        return batch
 
     async def get_by_id(self, batch_id: UUID) -> TaskBatch | None:
         """Get a batch by ID with tasks.
@@ -70,51 +83,82 @@ class BatchService:
         Returns:
             Batch with tasks if found, None otherwise
         """
+        # lambda_stmt caches the constructed statement; batch_id becomes a bound parameter
         result = await self.db.execute(
-            select(TaskBatch).where(TaskBatch.id == batch_id).options(selectinload(TaskBatch.tasks))
+            lambda_stmt(
+                lambda: select(TaskBatch)
+                .where(TaskBatch.id == batch_id)
+                .options(selectinload(TaskBatch.tasks))
+            )
         )
-        return result.scalar_one_or_none()
+        batch: TaskBatch | None = result.scalar_one_or_none()
+        return batch
 
     async def get_list(
         self,
         page: int = 1,
         session_id: UUID | None = None,
-    ) -> tuple[list[TaskBatch], int]:
+        after: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[TaskBatch], int | None, bool]:
         """Get paginated list of batches.
 
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when after is given
             session_id: Optional session ID filter
+            after: Optional (created_at, id) keyset position of the previous page's last batch
 
         Returns:
-            Tuple of (batches list, total count)
+            Tuple of (batches list, total count, whether more batches follow this page).
+            The total is None when after is given.
         """
         limit = 10
         offset = (page - 1) * limit
+        # One extra row tells whether another page follows
+        fetch = limit + 1
 
-        # Build queries
-        query = select(TaskBatch).options(selectinload(TaskBatch.tasks))
-        count_query = select(func.count()).select_from(TaskBatch)
+        # Build query (lambda_stmt caches each composed statement shape); tasks are
+        # joined onto the limited page instead of loaded by a second IN query
+        query = lambda_stmt(lambda: select(TaskBatch).options(joinedload(TaskBatch.tasks)))
 
         # Apply filters
         if session_id is not None:
-            query = query.where(TaskBatch.session_id == session_id)
-            count_query = count_query.where(TaskBatch.session_id == session_id)
-
-        # Sort by created_at desc (newest first)
-        query = query.order_by(TaskBatch.created_at.desc())
-
-        # Apply pagination
-        query = query.offset(offset).limit(limit)
-
-        # Execute queries
-        batches_result = await self.db.execute(query)
-        batches = list(batches_result.scalars().all())
-
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar_one()
+            query += lambda s: s.where(TaskBatch.session_id == session_id)
+
+        # Sort by created_at desc (newest first), id as tie-breaker
+        query += lambda s: s.order_by(TaskBatch.created_at.desc(), TaskBatch.id.desc())
+
+        # Apply pagination: seek past the cursor position, or fall back to OFFSET
+        if after is not None:
+            seek = tuple_(TaskBatch.created_at, TaskBatch.id) < after
+            query += lambda s: s.where(seek).limit(fetch)
+        else:
+            # COUNT(*) OVER () runs before OFFSET/LIMIT, so each row carries the total
+            query += (
+                lambda s: s.add_columns(func.count().over().label("total"))
+                .offset(offset)
+                .limit(fetch)
+            )
 
-        return batches, total
+        # Execute query (unique() collapses the per-task rows of the join)
+        rows = (await self.db.execute(query)).unique().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        batches = [row[0] for row in rows]
+
+        # Cursor pages skip the total: a filtered COUNT(*) costs as much as the OFFSET
+        # scan the seek avoids
+        total: int | None = None
+        if rows and after is None:
+            total = rows[0].total
+        elif after is None:
+            # An empty page has no row to read the total from
+            count_query = lambda_stmt(lambda: select(func.count()).select_from(TaskBatch))
+            if session_id is not None:
+                count_query += lambda s: s.where(TaskBatch.session_id == session_id)
+            count_result = await self.db.execute(count_query)
+            total = count_result.scalar_one()
+
+        return batches, total, has_more
 
     async def get_latest(self, session_id: UUID | None = None) -> TaskBatch | None:
         """Get the most recent batch.
@@ -125,15 +169,13 @@ class BatchService:
         Returns:
             Latest batch if found, None otherwise
         """
-        query = (
-            select(TaskBatch)
-            .options(selectinload(TaskBatch.tasks))
-            .order_by(TaskBatch.created_at.desc())
-            .limit(1)
-        )
+        query = lambda_stmt(lambda: select(TaskBatch).options(joinedload(TaskBatch.tasks)))
 
         if session_id is not None:
-            query = query.where(TaskBatch.session_id == session_id)
+            query += lambda s: s.where(TaskBatch.session_id == session_id)
+
+        query += lambda s: s.order_by(TaskBatch.created_at.desc()).limit(1)
 
         result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        batch: TaskBatch | None = result.unique().scalar_one_or_none()
+        return batch
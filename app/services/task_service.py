@@ -1,14 +1,101 @@
 """Task service for CRUD operations."""
 
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import Any, Literal
 from uuid import UUID
 
-from sqlalchemy import Select, case, func, select
+from sqlalchemy import (
+    Row,
+    Select,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    lambda_stmt,
+    select,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import ValidationError
 from app.models.task import Task, TaskPriority, TaskStatus
-from app.schemas.task import TaskBulkUpdate, TaskCreate, TaskUpdate
+from app.schemas.task import TaskBulkUpdate, TaskCreate, TaskResponse, TaskUpdate
+from app.services.batch_service import batch_cache
+from app.utils.cache import TTLCache
+
+# Enum members are singletons, so Python-side status checks can use identity
+_COMPLETED = TaskStatus.COMPLETED
+
+# Short-lived per-process cache of GET /tasks/{task_id} responses; invalidated on
+# writes. It holds frozen TaskResponse models, never session-bound Task instances.
+task_cache: TTLCache[UUID, TaskResponse] = TTLCache(maxsize=4096, ttl=2)
+
+
+# Sort fields that support keyset (cursor) pagination: non-null timestamps
+KEYSET_SORT_FIELDS = ("updated_at", "created_at")
+
+# Columns of the VALUES list fed to bulk_update's UPDATE ... FROM
+_BULK_UPDATE_FIELDS = ("id", "title", "description", "status", "priority", "due_date")
+
+# Columns read by get_list: exactly the TaskResponse fields, no ORM hydration
+_LIST_COLUMNS = tuple(getattr(Task, name) for name in TaskResponse.model_fields)
+
+# ORDER BY clauses per (sort_by, order), built once at import
+_SORT_ORDERS: dict[tuple[str, str], tuple[Any, ...]] = {
+    # Priority sorting: custom order with NULL at the end
+    # low > medium > high > NULL
+    ("priority", "asc"): (
+        case(
+            (Task.priority == TaskPriority.LOW, 1),
+            (Task.priority == TaskPriority.MEDIUM, 2),
+            (Task.priority == TaskPriority.HIGH, 3),
+            (Task.priority.is_(None), 4),
+        ),
+    ),
+    # high > medium > low > NULL
+    ("priority", "desc"): (
+        case(
+            (Task.priority == TaskPriority.HIGH, 1),
+            (Task.priority == TaskPriority.MEDIUM, 2),
+            (Task.priority == TaskPriority.LOW, 3),
+            (Task.priority.is_(None), 4),
+        ),
+    ),
+    # Status sorting: custom order
+    # pending > in_progress > completed
+    ("status", "asc"): (
+        case(
+            (Task.status == TaskStatus.PENDING, 1),
+            (Task.status == TaskStatus.IN_PROGRESS, 2),
+            (Task.status == TaskStatus.COMPLETED, 3),
+        ),
+    ),
+    # completed > in_progress > pending
+    ("status", "desc"): (
+        case(
+            (Task.status == TaskStatus.COMPLETED, 1),
+            (Task.status == TaskStatus.IN_PROGRESS, 2),
+            (Task.status == TaskStatus.PENDING, 3),
+        ),
+    ),
+    # NOT NULL timestamps: plain ASC/DESC, id as tie-breaker, so the (column, id)
+    # indexes serve both directions (NULLS LAST would not match a backward scan)
+    **{
+        (name, "asc"): (getattr(Task, name).asc(), Task.id.asc())
+        for name in ("updated_at", "created_at")
+    },
+    **{
+        (name, "desc"): (getattr(Task, name).desc(), Task.id.desc())
+        for name in ("updated_at", "created_at")
+    },
+    # Nullable due_date: NULL at the end, id as tie-breaker
+    ("due_date", "asc"): (Task.due_date.asc().nullslast(), Task.id.asc()),
+    ("due_date", "desc"): (Task.due_date.desc().nullslast(), Task.id.desc()),
+}
 
 
 class TaskService:
@@ -41,7 +128,6 @@ class TaskService:
         )
         self.db.add(task)
         await self.db.commit()
-        await self.db.refresh(task)
         return task
 
     async def get_by_id(self, task_id: UUID) -> Task | None:
@@ -53,8 +139,10 @@ class TaskService:
         Returns:
             Task if found, None otherwise
         """
-        result = await self.db.execute(select(Task).where(Task.id == task_id))
-        return result.scalar_one_or_none()
+        # lambda_stmt caches the constructed statement; task_id becomes a bound parameter
+        result = await self.db.execute(lambda_stmt(lambda: select(Task).where(Task.id == task_id)))
+        task: Task | None = result.scalar_one_or_none()
+        return task
 
     async def get_list(
         self,
@@ -66,54 +154,81 @@ class TaskService:
             "updated_at", "created_at", "due_date", "priority", "status"
         ] = "updated_at",
         order: Literal["asc", "desc"] = "desc",
-    ) -> tuple[list[Task], int]:
+        after: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[Row[Any]], int | None, bool]:
         """Get paginated list of tasks with filtering and sorting.
 
+        Rows hold plain column values (one per TaskResponse field) rather than
+        Task instances, so the page skips ORM object construction.
+
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when after is given
             status: Optional status filter
             session_id: Optional session ID filter
             batch_id: Optional batch ID filter
             sort_by: Sort field (default: updated_at)
             order: Sort order (default: desc)
+            after: Optional (sort value, id) keyset position of the previous page's last task.
+                Only valid for the updated_at and created_at sorts.
 
         Returns:
-            Tuple of (tasks list, total count)
+            Tuple of (task rows, total count, whether more rows follow this page).
+            The total is None when after is given.
+
+        Raises:
+            ValidationError: If after is given for a sort without keyset support
         """
+        if after is not None and sort_by not in KEYSET_SORT_FIELDS:
+            raise ValidationError(
+                f"Keyset pagination is not supported for sort_by={sort_by}",
+                details={"sort_by": sort_by},
+            )
+
         # Fixed limit: 10 tasks per page
         limit = 10
         # Calculate offset: (page - 1) * limit
         offset = (page - 1) * limit
 
-        # Build base query
-        query = select(Task)
-        count_query = select(func.count()).select_from(Task)
-
-        # Apply filters
+        # Build filters
+        filters = []
         if status is not None:
-            query = query.where(Task.status == status)
-            count_query = count_query.where(Task.status == status)
+            filters.append(Task.status == status)
         if session_id is not None:
-            query = query.where(Task.session_id == session_id)
-            count_query = count_query.where(Task.session_id == session_id)
+            filters.append(Task.session_id == session_id)
         if batch_id is not None:
-            query = query.where(Task.batch_id == batch_id)
-            count_query = count_query.where(Task.batch_id == batch_id)
+            filters.append(Task.batch_id == batch_id)
 
-        # Apply sorting
-        query = self._apply_sorting(query, sort_by, order)
+        # Build base query and apply sorting
+        query = self._apply_sorting(select(*_LIST_COLUMNS).where(*filters), sort_by, order)
 
-        # Apply pagination
-        query = query.offset(offset).limit(limit)
-
-        # Execute queries
-        tasks_result = await self.db.execute(query)
-        tasks = list(tasks_result.scalars().all())
-
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar_one()
-
-        return tasks, total
+        # Apply pagination: seek past the cursor position, or fall back to OFFSET
+        if after is not None:
+            position = tuple_(getattr(Task, sort_by), Task.id)
+            query = query.where(position < after if order == "desc" else position > after)
+        else:
+            # COUNT(*) OVER () runs before OFFSET/LIMIT, so each row carries the total
+            query = query.add_columns(func.count().over().label("total")).offset(offset)
+        # One extra row tells whether another page follows
+        query = query.limit(limit + 1)
+
+        # Execute query
+        rows = list((await self.db.execute(query)).all())
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # Cursor pages skip the total: a filtered COUNT(*) costs as much as the OFFSET
+        # scan the seek avoids
+        total: int | None = None
+        if rows and after is None:
+            total = rows[0].total
+        elif after is None:
+            # An empty page has no row to read the total from
+            count_result = await self.db.execute(
+                select(func.count()).select_from(Task).where(*filters)
+            )
+            total = count_result.scalar_one()
+
+        return rows, total, has_more
 
     def _apply_sorting(
         self,
@@ -131,55 +246,7 @@ class TaskService:
         Returns:
             Query with sorting applied
         """
-        if sort_by == "priority":
-            # Priority sorting: custom order with NULL at the end
-            if order == "asc":
-                # low > medium > high > NULL
-                return query.order_by(
-                    case(
-                        (Task.priority == TaskPriority.LOW, 1),
-                        (Task.priority == TaskPriority.MEDIUM, 2),
-                        (Task.priority == TaskPriority.HIGH, 3),
-                        (Task.priority.is_(None), 4),
-                    )
-                )
-            else:  # desc
-                # high > medium > low > NULL
-                return query.order_by(
-                    case(
-                        (Task.priority == TaskPriority.HIGH, 1),
-                        (Task.priority == TaskPriority.MEDIUM, 2),
-                        (Task.priority == TaskPriority.LOW, 3),
-                        (Task.priority.is_(None), 4),
-                    )
-                )
-        elif sort_by == "status":
-            # Status sorting: custom order
-            if order == "asc":
-                # pending > in_progress > completed
-                return query.order_by(
-                    case(
-                        (Task.status == TaskStatus.PENDING, 1),
-                        (Task.status == TaskStatus.IN_PROGRESS, 2),
-                        (Task.status == TaskStatus.COMPLETED, 3),
-                    )
-                )
-            else:  # desc
-                # completed > in_progress > pending
-                return query.order_by(
-                    case(
-                        (Task.status == TaskStatus.COMPLETED, 1),
-                        (Task.status == TaskStatus.IN_PROGRESS, 2),
-                        (Task.status == TaskStatus.PENDING, 3),
-                    )
-                )
-        else:
-            # Standard column sorting with NULL at the end
-            sort_column = getattr(Task, sort_by)
-            if order == "asc":
-                return query.order_by(sort_column.asc().nullslast())
-            else:  # desc
-                return query.order_by(sort_column.desc().nullslast())
+        return query.order_by(*_SORT_ORDERS[(sort_by, order)])
 
     async def update(self, task_id: UUID, task_data: TaskUpdate) -> Task | None:
         """Update a task.
@@ -195,39 +262,38 @@ class TaskService:
         Returns:
             Updated task if found, None otherwise
         """
-        task = await self.get_by_id(task_id)
-        if task is None:
-            return None
-
-        # Store old status for comparison
-        old_status = task.status
-
-        # Update fields if provided
-        if task_data.title is not None:
-            task.title = task_data.title
-        if task_data.description is not None:
-            task.description = task_data.description
-        if task_data.status is not None:
-            task.status = task_data.status
-        if task_data.priority is not None:
-            task.priority = task_data.priority
-        if task_data.due_date is not None:
-            task.due_date = task_data.due_date
+        # Only fields that were provided are updated
+        fields: dict[str, Any] = task_data.model_dump(exclude_none=True)
+        if not fields:
+            return await self.get_by_id(task_id)
 
-        # Handle completed_at auto-management
+        # Handle completed_at auto-management in SQL, against the row's current status
         if task_data.status is not None:
-            new_status = task_data.status
-
-            # completed로 변경: completed_at 자동 설정
-            if new_status == TaskStatus.COMPLETED and old_status != TaskStatus.COMPLETED:
-                task.completed_at = datetime.now(UTC)
+            if task_data.status is _COMPLETED:
+                # completed로 변경: completed_at 자동 설정
+                fields["completed_at"] = case(
+                    (Task.status != _COMPLETED, func.now()), else_=Task.completed_at
+                )
+            else:
+                # completed에서 다른 상태로: completed_at 초기화
+                fields["completed_at"] = case(
+                    (Task.status == _COMPLETED, None), else_=Task.completed_at
+                )
 
-            # completed에서 다른 상태로: completed_at 초기화
-            elif old_status == TaskStatus.COMPLETED and new_status != TaskStatus.COMPLETED:
-                task.completed_at = None
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        result = await self.db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(**fields)
+            .returning(Task)
+            .execution_options(synchronize_session=False)
+        )
+        task: Task | None = result.scalar_one_or_none()
+        if task is None:
+            return None
 
         await self.db.commit()
-        await self.db.refresh(task)
+        self._invalidate([task_id])
         return task
 
     async def delete(self, task_id: UUID) -> bool:
@@ -239,12 +305,13 @@ class TaskService:
         Returns:
             True if deleted, False if not found
         """
-        task = await self.get_by_id(task_id)
-        if task is None:
+        # Single DELETE ... RETURNING instead of a SELECT followed by the DELETE
+        result = await self.db.execute(delete(Task).where(Task.id == task_id).returning(Task.id))
+        if result.scalar_one_or_none() is None:
             return False
 
-        await self.db.delete(task)
         await self.db.commit()
+        self._invalidate([task_id])
         return True
 
     async def bulk_update(self, bulk_data: TaskBulkUpdate) -> list[Task]:
@@ -256,44 +323,53 @@ class TaskService:
         Returns:
             List of updated tasks (only successfully updated ones)
         """
-        updated_tasks: list[Task] = []
-
+        # One VALUES row per task; repeated IDs are merged, later non-null fields win
+        changes: dict[UUID, dict[str, Any]] = {}
         for item in bulk_data.tasks:
-            task = await self.get_by_id(item.id)
-            if task is None:
-                continue
-
-            # Store old status for comparison
-            old_status = task.status
-
-            # Update fields if provided
-            if item.title is not None:
-                task.title = item.title
-            if item.description is not None:
-                task.description = item.description
-            if item.status is not None:
-                task.status = item.status
-            if item.priority is not None:
-                task.priority = item.priority
-            if item.due_date is not None:
-                task.due_date = item.due_date
-
-            # Handle completed_at auto-management
-            if item.status is not None:
-                new_status = item.status
-                if new_status == TaskStatus.COMPLETED and old_status != TaskStatus.COMPLETED:
-                    task.completed_at = datetime.now(UTC)
-                elif old_status == TaskStatus.COMPLETED and new_status != TaskStatus.COMPLETED:
-                    task.completed_at = None
-
-            updated_tasks.append(task)
+            changes.setdefault(item.id, {"id": item.id}).update(
+                item.model_dump(exclude={"id"}, exclude_none=True)
+            )
+        new = values(
+            *(column(name, getattr(Task, name).type) for name in _BULK_UPDATE_FIELDS),
+            name="changes",
+        ).data(
+            [tuple(fields.get(name) for name in _BULK_UPDATE_FIELDS) for fields in changes.values()]
+        )
 
-        await self.db.commit()
+        # An all-NULL VALUES column comes back untyped (text) from PostgreSQL, so
+        # each column is cast back to the task column's type
+        title, description, status, priority, due_date = (
+            cast(new.c[name], getattr(Task, name).type) for name in _BULK_UPDATE_FIELDS[1:]
+        )
 
-        # Refresh all updated tasks
-        for task in updated_tasks:
-            await self.db.refresh(task)
+        # Single UPDATE ... FROM (VALUES ...) RETURNING. Fields passed as None keep
+        # their current value, and completed_at follows the same rules as update(),
+        # evaluated in SQL against each row's current status.
+        result = await self.db.execute(
+            update(Task)
+            .where(Task.id == new.c.id)
+            .values(
+                title=func.coalesce(title, Task.title),
+                description=func.coalesce(description, Task.description),
+                status=func.coalesce(status, Task.status),
+                priority=func.coalesce(priority, Task.priority),
+                due_date=func.coalesce(due_date, Task.due_date),
+                completed_at=case(
+                    (and_(status == _COMPLETED, Task.status != _COMPLETED), func.now()),
+                    (and_(Task.status == _COMPLETED, status != _COMPLETED), None),
+                    else_=Task.completed_at,
+                ),
+            )
+            .returning(Task)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
 
+        # Keep request order
+        tasks_by_id = {task.id: task for task in result.scalars()}
+        updated_tasks = [tasks_by_id[item.id] for item in bulk_data.tasks if item.id in tasks_by_id]
+
+        await self.db.commit()
+        self._invalidate([item.id for item in bulk_data.tasks])
         return updated_tasks
 
     async def bulk_delete(self, task_ids: list[UUID]) -> int:
@@ -305,13 +381,17 @@ class TaskService:
         Returns:
             Number of deleted tasks
         """
-        deleted_count = 0
-
-        for task_id in task_ids:
-            task = await self.get_by_id(task_id)
-            if task is not None:
-                await self.db.delete(task)
-                deleted_count += 1
+        # Single DELETE ... RETURNING instead of a SELECT and DELETE per ID
+        result = await self.db.execute(delete(Task).where(Task.id.in_(task_ids)).returning(Task.id))
+        deleted_count = len(result.scalars().all())
 
         await self.db.commit()
+        self._invalidate(task_ids)
         return deleted_count
+
+    @staticmethod
+    def _invalidate(task_ids: list[UUID]) -> None:
+        """Drop cached copies of changed tasks and of batches that may embed them."""
+        for task_id in task_ids:
+            task_cache.pop(task_id)
+        batch_cache.clear()
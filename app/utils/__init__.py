@@ -1,5 +1,7 @@
 """Utils package."""
 
+from app.utils.cache import TTLCache
 from app.utils.http_client import HTTPClient
+from app.utils.pagination import decode_cursor, encode_cursor
 
-__all__ = ["HTTPClient"]
+__all__ = ["HTTPClient", "TTLCache", "encode_cursor", "decode_cursor"]
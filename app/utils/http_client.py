@@ -1,7 +1,7 @@
 """HTTP client wrapper using httpx."""
 
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
 import httpx
 
@@ -12,7 +12,15 @@ logger = logging.getLogger(__name__)
 
 
 class HTTPClient:
-    """Async HTTP client wrapper."""
+    """Async HTTP client wrapper.
+
+    Requests go through one process-wide ``httpx.AsyncClient`` (opened by
+    ``startup()`` in the app lifespan) so connections are pooled and kept alive
+    across requests. Outside the lifespan, ``async with HTTPClient(...)`` still
+    opens a private client for the duration of the block.
+    """
+
+    _shared: ClassVar[httpx.AsyncClient | None] = None
 
     def __init__(self, base_url: str = "", timeout: float = 30.0) -> None:
         """Initialize HTTP client."""
@@ -20,19 +28,39 @@ class HTTPClient:
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
 
+    @classmethod
+    async def startup(cls) -> None:
+        """Open the shared client."""
+        if cls._shared is None:
+            cls._shared = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the shared client and its pooled connections."""
+        if cls._shared is not None:
+            await cls._shared.aclose()
+            cls._shared = None
+
     async def __aenter__(self) -> "HTTPClient":
         """Enter async context."""
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            follow_redirects=True,
-        )
+        if HTTPClient._shared is None:
+            self._client = httpx.AsyncClient(follow_redirects=True)
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         """Exit async context."""
         if self._client:
             await self._client.aclose()
+            self._client = None
+
+    def _build_url(self, url: str) -> str:
+        """Join a relative URL onto base_url (same merging rule as httpx's base_url)."""
+        if not self.base_url or httpx.URL(url).is_absolute_url:
+            return url
+        return f"{self.base_url.rstrip('/')}/{url.lstrip('/')}"
 
     async def get(
         self,
@@ -78,39 +106,53 @@ class HTTPClient:
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """Perform HTTP request with logging."""
-        if not self._client:
+        client = self._client or HTTPClient._shared
+        if client is None:
             raise RuntimeError("HTTP client not initialized. Use 'async with' context manager.")
 
         # Add request ID to headers
         request_id = get_request_id()
-        if headers is None:
-            headers = {}
+        headers = {} if headers is None else headers
         headers["X-Request-ID"] = request_id
 
-        adapter = LoggerAdapter(logger, {"request_id": request_id})
-
-        adapter.debug(
-            f"HTTP request: {method} {url}",
-            extra={"method": method, "url": url, "params": params},
-        )
+        # Debug logs are skipped entirely (no formatting or extra dicts) unless enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "HTTP request: %s %s",
+                method,
+                url,
+                extra={"request_id": request_id, "method": method, "url": url, "params": params},
+            )
 
         try:
-            response = await self._client.request(
+            response = await client.request(
                 method=method,
-                url=url,
+                url=self._build_url(url),
                 params=params,
                 json=json,
                 headers=headers,
+                timeout=self.timeout,
             )
 
-            adapter.debug(
-                f"HTTP response: {method} {url} - {response.status_code}",
-                extra={"method": method, "url": url, "status_code": response.status_code},
-            )
+            if debug:
+                logger.debug(
+                    "HTTP response: %s %s - %s",
+                    method,
+                    url,
+                    response.status_code,
+                    extra={
+                        "request_id": request_id,
+                        "method": method,
+                        "url": url,
+                        "status_code": response.status_code,
+                    },
+                )
 
             return response
 
         except httpx.HTTPError as e:
+            adapter = LoggerAdapter(logger, {"request_id": request_id})
             adapter.error(
                 f"HTTP error: {method} {url}",
                 extra={"method": method, "url": url, "error": str(e)},
@@ -0,0 +1,60 @@
+"""Keyset pagination cursor helpers."""
+
+import base64
+from datetime import datetime
+from uuid import UUID
+
+from app.core.exceptions import ValidationError
+
+
+def encode_cursor(sort_by: str, order: str, value: datetime, item_id: UUID) -> str:
+    """Encode the sort position of the last item on a page.
+
+    Args:
+        sort_by: Name of the sort column the cursor belongs to
+        order: Sort order the cursor belongs to
+        value: Sort column value of the last item
+        item_id: ID of the last item (tie-breaker)
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    raw = f"{sort_by}|{order}|{value.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, order: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous response
+        sort_by: Sort column the current request is ordered by
+        order: Sort order of the current request
+
+    Returns:
+        Tuple of (sort column value, item ID)
+
+    Raises:
+        ValidationError: If the cursor is malformed or was issued for another sort
+            column or order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        cursor_sort_by, cursor_order, value, item_id = raw.split("|")
+        position = (datetime.fromisoformat(value), UUID(item_id))
+    except ValueError as e:
+        raise ValidationError("Invalid cursor", details={"cursor": cursor}) from e
+
+    if cursor_sort_by != sort_by:
+        raise ValidationError(
+            f"Cursor was issued for sort_by={cursor_sort_by}",
+            details={"cursor": cursor, "sort_by": sort_by},
+        )
+    # The seek direction follows the order, so a cursor from the other order
+    # would silently return the wrong page
+    if cursor_order != order:
+        raise ValidationError(
+            f"Cursor was issued for order={cursor_order}",
+            details={"cursor": cursor, "order": order},
+        )
+    return position